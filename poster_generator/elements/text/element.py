@@ -141,25 +141,42 @@ class TextElement(DrawableElement):
             logger.warning("Unknown wrap_style '%s' for TextElement, defaulting to no wrapping.", self.wrap_style)
             return text
 
-        lines = []
-        current = []
+        lines = self._wrap_tokens(tokens, joiner, self.font.getlength(text) / len(text)) if tokens else []
 
-        for token in tokens:
-            # Try adding the next token
-            test_line = joiner.join([*current, token])
-            w = self.font.getlength(test_line)
+        logger.debug("Wrapped text lines: %s", lines)
 
-            if w <= self.max_width or not current:
-                current.append(token)
-            else:
-                # commit line
-                lines.append(joiner.join(current))
-                current = [token]
+        return lines
 
-        if current:
-            lines.append(joiner.join(current))
+    def _wrap_tokens(self, tokens, joiner, char_width):
+        """Greedily fill lines with tokens, each line holding at least one token.
 
-        logger.debug("Wrapped text lines: %s", lines)
+        Rather than measuring the line after every token, the line end is first estimated from the average
+        character width and then moved a token at a time until the measured width just fits.
+        """
+        getlength = self.font.getlength
+        max_width = self.max_width
+        budget = max_width / char_width if char_width else float("inf")
+        count = len(tokens)
+
+        lines = []
+        start = 0
+        while start < count:
+            end = start + 1
+            chars = len(tokens[start])
+            while end < count and chars + len(joiner) + len(tokens[end]) <= budget:
+                chars += len(joiner) + len(tokens[end])
+                end += 1
+
+            if getlength(joiner.join(tokens[start:end])) <= max_width:
+                while end < count and getlength(joiner.join(tokens[start : end + 1])) <= max_width:
+                    end += 1
+            else:
+                end -= 1
+                while end > start + 1 and getlength(joiner.join(tokens[start:end])) > max_width:
+                    end -= 1
+
+            lines.append(joiner.join(tokens[start:end]))
+            start = end
 
         return lines
 
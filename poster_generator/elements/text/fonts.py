@@ -15,12 +15,14 @@ class FontManager:
     Attributes:
         font_families (dict): Mapping of font family names to their file paths.
         font_cache (dict): Cache of loaded fonts to avoid redundant loading.
+        family_cache (dict): Fonts by requested (family name, size), skipping path resolution on repeat lookups.
     """
     DEFAULT_FONT_PATH = ROOT_DIR / "resources/fonts/open_sans.ttf"
 
     def __init__(self):
         self.font_families = {}
         self.font_cache = {}
+        self.family_cache = {}
 
         self._register_inbuilt_fonts()
         self._register_system_fonts()
@@ -74,6 +76,8 @@ class FontManager:
         if alternate_names:
             for alt_name in alternate_names:
                 self.font_families[alt_name.lower()] = Path(font_path)
+        # A registration can change which file a family name resolves to
+        self.family_cache.clear()
 
     def get_font(self, family_name: str, font_size: int):
         """Retrieve a font from the cache or load it if not cached.
@@ -85,6 +89,10 @@ class FontManager:
         Returns:
             ImageFont.FreeTypeFont: Loaded font object.
         """
+        font = self.family_cache.get((family_name, font_size))
+        if font is not None:
+            return font
+
         if family_name is None:
             msg = "Font family name cannot be None, given: ", family_name
             raise ValueError(msg)
@@ -104,7 +112,9 @@ class FontManager:
             font = ImageFont.truetype(str(font_path), font_size)
             self.font_cache[cache_key] = font
 
-        return self.font_cache[cache_key]
+        font = self.font_cache[cache_key]
+        self.family_cache[family_name, font_size] = font
+        return font
 
     def get_all_families(self) -> list[str]:
         """Get a list of all registered font family names.
@@ -1,5 +1,7 @@
 """Factory for registering and applying image operations."""
 
+import sys
+
 from poster_generator.operations.image import apply_hue_shift, set_hue_from_hex
 from poster_generator.operations.text import randomize_text_color
 
@@ -13,7 +15,8 @@ class OperationFactory:
     """
 
     def __init__(self):
-        self._registry = {}
+        self._funcs = {}
+        self._types = {}
         self._register_defaults()
 
     def _register_defaults(self):
@@ -31,7 +34,10 @@ class OperationFactory:
             operation_func: Callable that performs the operation.
             supported_types: List of element type names this operation supports.
         """
-        self._registry[operation_name] = {"func": operation_func, "supported_types": supported_types}
+        # Interned so lookups with interned names from parsed templates match by identity
+        operation_name = sys.intern(operation_name)
+        self._funcs[operation_name] = operation_func
+        self._types[operation_name] = frozenset(supported_types)
 
     def get_operation(self, operation_name: str):
         """
@@ -44,7 +50,36 @@ class OperationFactory:
             dict or None: Operation info dict with 'func' and 'supported_types' keys,
                          or None if not found.
         """
-        return self._registry.get(operation_name, None)
+        func = self._funcs.get(operation_name)
+        if func is None:
+            return None
+        return {"func": func, "supported_types": self._types[operation_name]}
+
+    def get_func(self, operation_name: str):
+        """
+        Retrieve a registered operation's callable by name.
+
+        Args:
+            operation_name: Name of the operation to retrieve.
+
+        Returns:
+            Callable or None: The operation function, or None if not found.
+        """
+        return self._funcs.get(operation_name)
+
+    def supports(self, operation_name: str, element_type: str) -> bool:
+        """
+        Check if a registered operation supports an element type.
+
+        Args:
+            operation_name: Name of the operation to check.
+            element_type: Element type name to check against.
+
+        Returns:
+            bool: True if the operation is registered and supports the element type.
+        """
+        supported_types = self._types.get(operation_name)
+        return supported_types is not None and element_type in supported_types
 
     def get_registered_types(self) -> list[str]:
         """
@@ -53,7 +88,7 @@ class OperationFactory:
         Returns:
             list[str]: List of registered operation names.
         """
-        return list(self._registry.keys())
+        return list(self._funcs.keys())
 
     def is_registered(self, element_type: str) -> bool:
         """
@@ -65,7 +100,7 @@ class OperationFactory:
         Returns:
             bool: True if the operation is registered.
         """
-        return element_type in self._registry
+        return element_type in self._funcs
 
 
 # Global factory instance for convenience
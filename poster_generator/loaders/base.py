@@ -168,12 +168,12 @@ class BaseCanvasLoader(ABC):
         factory = get_operation_factory()
 
         for op_name, op_kwargs in operations.items():
-            op_entry = factory.get_operation(op_name)
-            if op_entry is None:
+            op_func = factory.get_func(op_name)
+            if op_func is None:
                 logger.warning("For element %s, operation '%s' not found in factory. Skipping.", element_id, op_name)
                 continue
 
-            if element_type not in op_entry["supported_types"]:
+            if not factory.supports(op_name, element_type):
                 logger.warning(
                     "For element %s, operation '%s' not supported for element type '%s'. Skipping.",
                     element_id,
@@ -183,7 +183,7 @@ class BaseCanvasLoader(ABC):
                 continue
 
             logger.debug("Applying operation '%s' to element '%s'.", op_name, element_id)
-            element.apply_operation(op_entry["func"], kwargs=op_kwargs)
+            element.apply_operation(op_func, kwargs=op_kwargs)
 
         return element
 
@@ -1,19 +1,123 @@
+import contextlib
+import copy
+import functools
 import json
+import os
+import pickle
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import yaml
 
 from .loader import LayerBasedLoader
 
+# Use the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+
+@functools.lru_cache(maxsize=128)
+def _memoized_read(read, path: str, mtime_ns: int, size: int) -> dict:
+    """Memoize read(path), the modification time and size only key the cache so edited files are reread."""
+    return read(path)
+
 
 class YamlLoader(LayerBasedLoader):
     """
     Canvas loader for YAML configuration files.
     """
 
+    # PyYAML loader class used to parse sources, override to customise parsing
+    YAML_LOADER = _SafeLoader
+
+    # Top-level schema declaration, expected within the first few lines of a template
+    SCHEMA_HEADER_PATTERN = re.compile(rb"""^schema:[ \t]*["']?([0-9.]+)["']?[ \t]*(?:#.*)?$""", re.MULTILINE)
+    SCHEMA_HEADER_SIZE = 256
+
+    # Opt-in cache of parsed sources, pickled next to each file as "<path>.cache" and reused while the
+    # source is unchanged. Only enable for trusted template directories, as cache files are unpickled.
+    CACHE_PARSED_SOURCES = False
+    CACHE_SUFFIX = ".cache"
+
+    # Upper bound on threads used by load_many()
+    MAX_LOAD_WORKERS = 8
+
     def read_source(self, path: str) -> dict:
-        with Path(path).open() as f:
-            return yaml.safe_load(f)
+        source = Path(path).absolute()
+        stat = source.stat()
+        # Parsed templates are memoized, hand out copies so mutating a result cannot leak into later reads
+        data = _memoized_read(self._read_uncached_source, str(source), stat.st_mtime_ns, stat.st_size)
+        return copy.deepcopy(data)
+
+    def _read_uncached_source(self, path: str) -> dict:
+        if self.CACHE_PARSED_SOURCES:
+            return self._read_pickled_source(path)
+        return self._parse_source(path)
+
+    def _parse_source(self, path: str) -> dict:
+        # Binary mode lets libyaml detect the encoding and skip Python-side decoding
+        with Path(path).open("rb") as f:
+            self._peek_schema(f)
+            return yaml.load(f, Loader=self.YAML_LOADER)  # noqa: S506
+
+    def _read_pickled_source(self, path: str) -> dict:
+        """
+        Read a source through its pickle cache, reparsing and rewriting the cache when the source changed.
+
+        Cache files that cannot be read or written are ignored, so read-only directories still work.
+        """
+        source = Path(path)
+        stat = source.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cache_path = source.with_name(source.name + self.CACHE_SUFFIX)
+
+        with contextlib.suppress(OSError, EOFError, pickle.UnpicklingError, ValueError):
+            cached_signature, data = pickle.loads(cache_path.read_bytes())  # noqa: S301
+            if cached_signature == signature:
+                return data
+
+        data = self._parse_source(path)
+        with contextlib.suppress(OSError):
+            cache_path.write_bytes(pickle.dumps((signature, data), protocol=pickle.HIGHEST_PROTOCOL))
+        return data
+
+    def load_many(self, paths, variables=None) -> list:
+        """
+        Build a Canvas for each of several YAML files.
+
+        Files are read and parsed concurrently, the libyaml parser releases the GIL while it works.
+        Deserializing and building stay sequential since the loader holds per-build state.
+
+        Args:
+            paths: Iterable of file paths to load.
+            variables: Optional dict for variable substitution, shared by every file.
+
+        Returns:
+            list[Canvas]: Canvases in the same order as paths.
+        """
+        paths = list(paths)
+        if len(paths) < 2:  # noqa: PLR2004
+            sources = [self.read_source(path) for path in paths]
+        else:
+            max_workers = min(self.MAX_LOAD_WORKERS, len(paths), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                sources = list(executor.map(self.read_source, paths))
+
+        return [self.build_canvas(data, variables) for data in sources]
+
+    def _peek_schema(self, f):
+        """
+        Reject unsupported schema versions from the file header before parsing the whole file.
+
+        Falls back to the regular check in deserialize() when the header does not declare a schema.
+        """
+        match = self.SCHEMA_HEADER_PATTERN.search(f.read(self.SCHEMA_HEADER_SIZE))
+        f.seek(0)
+        if match:
+            self._validate_schema(match.group(1).decode())
 
 
 class JsonLoader(LayerBasedLoader):
@@ -24,4 +128,3 @@ class JsonLoader(LayerBasedLoader):
     def read_source(self, path: str) -> dict:
         with Path(path).open() as f:
             return json.load(f)
-
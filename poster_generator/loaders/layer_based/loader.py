@@ -1,6 +1,7 @@
 """YAML-based canvas configuration loader."""
 
 import logging
+import sys
 from abc import ABC
 
 from poster_generator.canvas import Canvas
@@ -23,6 +24,9 @@ class LayerBasedLoader(BaseCanvasLoader, ABC):
 
     SCHEMA_VERSION = "1.0"
 
+    # Stateless, so a single instance is shared by every alignment lookup
+    _ALIGNMENT_RESOLVER = PointResolver()
+
     def deserialize(self, data: dict, variables: dict) -> Canvas:
         """
         Deserialize YAML data into a normalized canvas configuration.
@@ -37,10 +41,7 @@ class LayerBasedLoader(BaseCanvasLoader, ABC):
         Raises:
             ValueError: If the schema version is unsupported.
         """
-        schema = data.get("schema", LayerBasedLoader.SCHEMA_VERSION)
-        if schema != LayerBasedLoader.SCHEMA_VERSION:
-            msg = f"Unsupported schema version: {schema}. Current version is {LayerBasedLoader.SCHEMA_VERSION}."
-            raise ValueError(msg)
+        self._validate_schema(data.get("schema", LayerBasedLoader.SCHEMA_VERSION))
 
         logger.debug("Deserializing YAML canvas configuration.")
 
@@ -69,26 +70,34 @@ class LayerBasedLoader(BaseCanvasLoader, ABC):
 
         return deserialized_info
 
+    def _validate_schema(self, schema):
+        if schema != LayerBasedLoader.SCHEMA_VERSION:
+            msg = f"Unsupported schema version: {schema}. Current version is {LayerBasedLoader.SCHEMA_VERSION}."
+            raise ValueError(msg)
+
     def _deserialize_settings(self, data: dict):
+        resolve = self.resolve
         settings_data = data.get("settings", {})
-        width = int(self.resolve(settings_data.get("width", 1080)))
-        height = int(self.resolve(settings_data.get("height", 1350)))
-        background = self.resolve(settings_data.get("background", "#fff"), key="background")
+        width = int(resolve(settings_data.get("width", 1080)))
+        height = int(resolve(settings_data.get("height", 1350)))
+        background = resolve(settings_data.get("background", "#fff"), key="background")
         return {"width": width, "height": height, "background": background}
 
     def _deserialize_anchors(self, data: dict):
-        anchors = {}
-        for anchor_id, anchor_data in data.get("anchors", {}).items():
-            anchors[anchor_id] = self.resolve(anchor_data, key="anchor")
-        return anchors
+        resolve = self.resolve
+        return {
+            anchor_id: resolve(anchor_data, key="anchor") for anchor_id, anchor_data in data.get("anchors", {}).items()
+        }
 
     def _deserialize_layers_elements(self, data: dict):
         layer_info = {}
         element_info = {}
+        parse_layer_settings = self._parse_layer_settings
+        parse_element = self._parse_element
 
         for layer_name, layer_data in data.get("layers", {}).items():
             logger.debug("Deserializing layer: %s", layer_name)
-            layer_info[layer_name] = self._parse_layer_settings(layer_data.get("settings", {}))
+            layer_info[layer_name] = parse_layer_settings(layer_data.get("settings", {}))
 
             elements_data = layer_data.get("elements")
             if elements_data is None:
@@ -97,7 +106,7 @@ class LayerBasedLoader(BaseCanvasLoader, ABC):
 
             for element_id, element_data in elements_data.items():
                 logger.debug("Deserializing element: %s in layer: %s", element_id, layer_name)
-                element_info[element_id] = self._parse_element(element_id, element_data, layer_name)
+                element_info[element_id] = parse_element(element_id, element_data, layer_name)
 
             logger.debug("Deserialized %i elements for layer %s", len(elements_data), layer_name)
 
@@ -146,15 +155,14 @@ class LayerBasedLoader(BaseCanvasLoader, ABC):
         element_info["layer"] = layer_name
         element_info["groups"] = element_data.get("groups", [])
 
-        values = {}
-        for k, v in element_data.get("values", {}).items():
-            values[k] = self.deep_resolve(v, key=k)
-        element_info["values"] = values
-
-        operations = {}
-        for ko, vo in element_data.get("operations", {}).items():
-            operations[ko] = self.deep_resolve(vo)
-        element_info["operations"] = operations
+        deep_resolve = self.deep_resolve
+        # Hooks may mutate these, so empty sections still get their own dict
+        raw_values = element_data.get("values")
+        element_info["values"] = {k: deep_resolve(v, key=k) for k, v in raw_values.items()} if raw_values else {}
+        raw_operations = element_data.get("operations")
+        element_info["operations"] = (
+            {sys.intern(ko): deep_resolve(vo) for ko, vo in raw_operations.items()} if raw_operations else {}
+        )
 
         # Support late relative positions
         if "position" in element_data:
@@ -169,7 +177,8 @@ class LayerBasedLoader(BaseCanvasLoader, ABC):
         return element_info
 
     def _parse_element_relative_position(self, element_id: str, rel_position_data: dict):
-        source = self.resolve(rel_position_data.get("source"))
+        resolve = self.resolve
+        source = resolve(rel_position_data.get("source"))
         if source is None:
             msg = f"For element {element_id}, 'source' must be specified for relative positioning."
             raise ValueError(msg)
@@ -179,13 +188,10 @@ class LayerBasedLoader(BaseCanvasLoader, ABC):
             msg = f"For element {element_id}, 'value' must be specified for relative positioning."
             raise ValueError(msg)
 
-        if "offset" in rel_position_data:
-            offset = self.resolve(rel_position_data.get("offset"), key="offset")
-        else:
-            offset = (0, 0)
+        offset = resolve(rel_position_data["offset"], key="offset") if "offset" in rel_position_data else (0, 0)
 
         # For specific parent element alignment
-        parent = self.resolve(rel_position_data.get("parent"))
+        parent = resolve(rel_position_data.get("parent"))
 
         return {
             "source": source,
@@ -225,20 +231,21 @@ class LayerBasedLoader(BaseCanvasLoader, ABC):
             raise ValueError(msg)
 
         logger.debug("Calculated position for element %s: %s", element_id, position)
-        return (position[0] + offset[0], position[1] + offset[1])
+        px, py = position
+        ox, oy = offset
+        return (px + ox, py + oy)
 
     def _calculate_anchor_position(self, element_id: str, anchor_name: str, anchors: dict):
         """Resolve position from an anchor."""
-        if not isinstance(anchor_name, str):
-            msg = f"For element '{element_id}', anchor name must be a string."
-            raise TypeError(msg)
-
-        anchor_position = anchors.get(anchor_name)
-        if anchor_position is None:
+        # Anchors are keyed by name, so only a failed lookup needs to validate the name's type
+        try:
+            return anchors[anchor_name]
+        except (KeyError, TypeError):
+            if not isinstance(anchor_name, str):
+                msg = f"For element '{element_id}', anchor name must be a string."
+                raise TypeError(msg) from None
             msg = f"For element '{element_id}', anchor '{anchor_name}' was not found."
-            raise ValueError(msg)
-
-        return anchor_position
+            raise ValueError(msg) from None
 
     def _calculate_element_reference_position(self, element_id: str, ref_element_id: str, canvas: Canvas):
         """Resolve position from another element."""
@@ -257,7 +264,9 @@ class LayerBasedLoader(BaseCanvasLoader, ABC):
         """Resolve position from alignment configuration."""
         logger.debug("Resolving alignment position with value: %s", value)
 
-        x_align, y_align = PointResolver().resolve("alignment", value, default_x=None, default_y=None)
+        x_align, y_align = LayerBasedLoader._ALIGNMENT_RESOLVER.resolve(
+            "alignment", value, default_x=None, default_y=None,
+        )
 
         parent_element_id = rel_position_info.get("parent")
         parent_element = canvas.get_first_element(identifier=parent_element_id) if parent_element_id else None
@@ -1,7 +1,10 @@
-import re
+from typing import Any
 
 from poster_generator.exceptions import VariableNotDefinedError
 
+# Leaf types that can never hold a variable, used to skip resolution entirely
+SCALAR_TYPES = frozenset({int, float, bool, type(None)})
+
 
 class PointResolver:
     """
@@ -9,38 +12,50 @@ class PointResolver:
     Supports multiple input formats: strings, lists, and dictionaries.
     """
 
-    POINT_DIMENSIONS = 2
-
-    def should_resolve(self, field_name):
-        return field_name in ("anchor", "position", "offset")
+    __slots__ = ()
 
-    def resolve_alphabetic_position(self, value):
-        value_lower = value.strip().lower()
-        if value_lower in ("left", "top"):
-            return 0.0
-        if value_lower in ("center", "middle"):
-            return 0.5
-        if value_lower in ("right", "bottom"):
-            return 1.0
-        return None
-
-    def resolve_position_value(self, value, default=0):
+    POINT_DIMENSIONS = 2
+    FIELD_NAMES = frozenset({"anchor", "position", "offset"})
+    ALPHABETIC_POSITIONS = {
+        "left": 0.0,
+        "top": 0.0,
+        "center": 0.5,
+        "middle": 0.5,
+        "right": 1.0,
+        "bottom": 1.0,
+    }
+    # Percentages common enough in layouts to skip float parsing for
+    COMMON_PERCENTAGES = {"0%": 0.0, "25%": 0.25, "50%": 0.5, "75%": 0.75, "100%": 1.0}
+
+    def should_resolve(self, field_name: str | None) -> bool:
+        return field_name in self.FIELD_NAMES
+
+    def resolve_alphabetic_position(self, value: str) -> float | None:
+        return self.ALPHABETIC_POSITIONS.get(value.strip().lower())
+
+    def resolve_position_value(self, value: Any, default: float | None = 0) -> float | None:
         if value is None:
             return default
 
+        # Numbers straight from the parser are the common case
+        if isinstance(value, (int, float)):
+            return float(value)
+
         # Handle string values
         if isinstance(value, str):
             value_lower = value.strip().lower()
 
-            n = self.resolve_alphabetic_position(value_lower)
+            n = self.ALPHABETIC_POSITIONS.get(value_lower)
             if n is not None:
                 return n
 
             # Handle percentages
             if value_lower.endswith("%"):
+                percentage = self.COMMON_PERCENTAGES.get(value_lower)
+                if percentage is not None:
+                    return percentage
                 try:
-                    percentage = float(value_lower[:-1])
-                    return percentage / 100.0
+                    return float(value_lower[:-1]) / 100.0
                 except ValueError as err:
                     msg = f"Invalid percentage value: {value}"
                     raise ValueError(msg) from err
@@ -52,22 +67,27 @@ class PointResolver:
             msg = f"Invalid position value: {value}"
             raise ValueError(msg) from err
 
-    def resolve(self, field_name, field_value, default_x=0, default_y=0):
+    def resolve(
+        self, field_name: str, field_value: Any, default_x: float | None = 0, default_y: float | None = 0,
+    ) -> tuple[float | None, float | None]:
         if isinstance(field_value, str):
-            parts = field_value.split(",")
-            if len(parts) != PointResolver.POINT_DIMENSIONS:
+            x_str, sep, y_str = field_value.partition(",")
+            if not sep or "," in y_str:
                 msg = f"Point string must be in 'x,y' format: {field_value}"
                 raise ValueError(msg)
-            x = self.resolve_position_value(parts[0].strip(), default_x)
-            y = self.resolve_position_value(parts[1].strip(), default_y)
+            x = self.resolve_position_value(x_str.strip(), default_x)
+            y = self.resolve_position_value(y_str.strip(), default_y)
 
         # Handle list format: [x, y]
         elif isinstance(field_value, list):
             if len(field_value) != PointResolver.POINT_DIMENSIONS:
                 msg = f"Point list must contain exactly 2 elements: {field_value}"
                 raise ValueError(msg)
-            x = self.resolve_position_value(field_value[0], default_x)
-            y = self.resolve_position_value(field_value[1], default_y)
+            x, y = field_value
+            if isinstance(x, (int, float)) and isinstance(y, (int, float)):
+                return (float(x), float(y))
+            x = self.resolve_position_value(x, default_x)
+            y = self.resolve_position_value(y, default_y)
 
         # Handle dict format: {x: ..., y: ...}
         elif isinstance(field_value, dict):
@@ -87,10 +107,14 @@ class ColorResolver:
     Supports multiple input formats: hex strings, RGB/RGBA tuples, and dictionaries.
     """
 
-    def should_resolve(self, field_name):
-        return field_name in ("background", "fill", "outline", "color")
+    __slots__ = ()
+
+    FIELD_NAMES = frozenset({"background", "fill", "outline", "color"})
+
+    def should_resolve(self, field_name: str | None) -> bool:
+        return field_name in self.FIELD_NAMES
 
-    def resolve(self, field_name, field_value):
+    def resolve(self, field_name: str, field_value: Any) -> Any:
         if isinstance(field_value, str):
             if field_value in {"none", "transparent"}:
                 return None
@@ -98,12 +122,9 @@ class ColorResolver:
         if isinstance(field_value, list) and len(field_value) in (3, 4):
             return tuple(field_value)
         if isinstance(field_value, dict):
-            keys = ("red", "green", "blue", "alpha")
-            try:
-                return tuple(field_value.get(k, 255) for k in keys)
-            except KeyError as err:
-                msg = f"Invalid color dictionary for field '{field_name}': missing key {err}"
-                raise ValueError(msg) from err
+            # Missing channels default to fully on
+            get = field_value.get
+            return (get("red", 255), get("green", 255), get("blue", 255), get("alpha", 255))
         return field_value
 
 
@@ -112,26 +133,55 @@ class LayerBasedResolver:
     Resolver for variables and additional field types in layer-based canvas configurations.
     Supports variable substitution and additional resolvers for specific field types."""
 
-    VARIABLE_PATTERN = r"--\$\{([^}]+)\}--"
+    __slots__ = ("_field_resolvers", "additional_resolvers", "variables")
 
-    def __init__(self, variables, additional_resolvers=None):
+    # Variables are written as the whole value, e.g. "--${title}--"
+    VARIABLE_PREFIX = "--${"
+    VARIABLE_SUFFIX = "}--"
+
+    def __init__(self, variables: dict[str, Any], additional_resolvers: list | None = None):
         self.variables = variables
         self.additional_resolvers = additional_resolvers or [
             ColorResolver(),
             PointResolver(),
         ]
+        # Field name -> resolvers that handle it, filled lazily
+        self._field_resolvers = {}
+
+    def _resolvers_for(self, field_name: str | None) -> tuple:
+        resolvers = self._field_resolvers.get(field_name)
+        if resolvers is None:
+            resolvers = tuple(extra for extra in self.additional_resolvers if extra.should_resolve(field_name))
+            self._field_resolvers[field_name] = resolvers
+        return resolvers
+
+    def _apply_resolvers(self, resolvers: tuple, field_name: str, field_value: Any) -> Any:
+        for extra in resolvers:
+            field_value = extra.resolve(field_name, field_value)
+        return field_value
 
-    def attempt_additional_resolution(self, field_name, field_value):
+    def attempt_additional_resolution(self, field_name: str | None, field_value: Any) -> Any:
         if field_name is None:
             return field_value
 
-        for extra in self.additional_resolvers:
-            if extra.should_resolve(field_name):
-                field_value = extra.resolve(field_name, field_value)
+        return self._apply_resolvers(self._resolvers_for(field_name), field_name, field_value)
 
-        return field_value
+    def _substitute_variable(self, value: Any) -> Any:
+        if not isinstance(value, str):
+            return value
+
+        if value.startswith(self.VARIABLE_PREFIX) and value.endswith(self.VARIABLE_SUFFIX):
+            var_name = value[len(self.VARIABLE_PREFIX) : -len(self.VARIABLE_SUFFIX)]
+            if var_name and "}" not in var_name:
+                variables = self.variables
+                if var_name not in variables:
+                    msg = f"Missing variable for template: {var_name}"
+                    raise VariableNotDefinedError(msg)
+                return variables[var_name]
 
-    def resolve_variable(self, value, key=None):
+        return value
+
+    def resolve_variable(self, value: Any, key: str | None = None) -> Any:
         """Resolve a variable in the given value string, usually to substitute variables or refactor.
 
         Args:
@@ -141,20 +191,12 @@ class LayerBasedResolver:
         Returns:
             The resolved value, with the first variable substituted and additional resolution applied.
         """
-        if not isinstance(value, str):
-            return self.attempt_additional_resolution(key, value)
+        value = self._substitute_variable(value)
+        if key is None:
+            return value
+        return self._apply_resolvers(self._resolvers_for(key), key, value)
 
-        match = re.match(self.VARIABLE_PATTERN, value)
-        if match:
-            var_name = match.group(1)
-            if var_name not in self.variables:
-                msg = f"Missing variable for template: {var_name}"
-                raise VariableNotDefinedError(msg)
-            value = self.variables[var_name]
-
-        return self.attempt_additional_resolution(key, value)
-
-    def deep_resolve_variables(self, data, key=None):
+    def deep_resolve_variables(self, data: Any, key: str | None = None) -> Any:
         """Recursively resolve variables in the given data structure.
 
         Args:
@@ -162,22 +204,47 @@ class LayerBasedResolver:
             key: The field name associated with the data, for additional resolution.
 
         Returns:
-            The data structure with all variables resolved.
+            The data structure with all variables resolved. Containers without anything to
+            resolve are returned as the same object rather than a copy.
         """
-        # Directly resolve if its a string or can be resolved by an additional resolver
-        matches_any_resolver = False
-        for resolver in self.additional_resolvers:
-            matches_any_resolver = resolver.should_resolve(key)
-            if matches_any_resolver:
-                break
+        # Plain scalars never hold a variable, so only field resolvers can change them
+        if type(data) in SCALAR_TYPES:
+            if key is None:
+                return data
+            resolvers = self._resolvers_for(key)
+            return self._apply_resolvers(resolvers, key, data) if resolvers else data
 
-        if matches_any_resolver or isinstance(data, str):
-            return self.resolve_variable(data, key=key)
+        # Directly resolve if its a string or can be resolved by an additional resolver
+        resolvers = self._resolvers_for(key)
+        if resolvers or isinstance(data, str):
+            data = self._substitute_variable(data)
+            return data if key is None else self._apply_resolvers(resolvers, key, data)
 
         if isinstance(data, dict):
-            return {k: self.deep_resolve_variables(v, key=k) for k, v in data.items()}
+            return self._deep_resolve_dict(data)
 
         if isinstance(data, list):
-            return [self.deep_resolve_variables(item, key=None) for item in data]
+            return self._deep_resolve_list(data)
 
         return data
+
+    def _deep_resolve_dict(self, data: dict) -> dict:
+        # Only copy once a child actually changes, untouched subtrees are returned as-is
+        resolved = None
+        for k, v in data.items():
+            new_v = self.deep_resolve_variables(v, key=k)
+            if new_v is not v:
+                if resolved is None:
+                    resolved = dict(data)
+                resolved[k] = new_v
+        return data if resolved is None else resolved
+
+    def _deep_resolve_list(self, data: list) -> list:
+        resolved = None
+        for i, item in enumerate(data):
+            new_item = self.deep_resolve_variables(item, key=None)
+            if new_item is not item:
+                if resolved is None:
+                    resolved = list(data)
+                resolved[i] = new_item
+        return data if resolved is None else resolved
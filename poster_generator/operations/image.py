@@ -1,6 +1,5 @@
 """Image transformation operations for color manipulation."""
 
-import colorsys
 import logging
 
 from PIL import Image
@@ -38,7 +37,8 @@ def apply_hue_shift(element, degrees: int | None = None) -> None:
     hsv = ensure_rgba(image).convert("HSV")
 
     h, s, v = hsv.split()
-    hue_shift_pixels = h.point(lambda p: (p + int(degrees * 255 / 360)) % 256)
+    shift = int(degrees * 255 / 360)
+    hue_shift_pixels = h.point([(p + shift) % 256 for p in range(256)])
 
     hsv = Image.merge("HSV", (hue_shift_pixels, s, v))
 
@@ -57,36 +57,46 @@ def set_hue_from_hex(element, hex_color: str | None = None) -> None:
         logger.warning("No valid hex color provided for set_hue_from_hex operation; skipping.")
         return
 
-    image = element.image
-
-    pixels = ensure_rgba(image).load()
-    width, height = image.size
+    image = ensure_rgba(element.image)
 
     hex_color = hex_color.lstrip("#")
     r_hex = int(hex_color[0:2], 16)
     g_hex = int(hex_color[2:4], 16)
     b_hex = int(hex_color[4:6], 16)
 
-    target_h, _, _ = colorsys.rgb_to_hsv(r_hex / 255.0, g_hex / 255.0, b_hex / 255.0)
-
-    for y in range(height):
-        for x in range(width):
-            r, g, b, a = pixels[x, y]
+    # Only the hue is needed, which is scale-invariant so the channels stay integers
+    max_c = max(r_hex, g_hex, b_hex)
+    delta = max_c - min(r_hex, g_hex, b_hex)
+    if delta == 0:
+        target_h = 0.0
+    elif max_c == r_hex:
+        target_h = ((g_hex - b_hex) / delta % 6) / 6
+    elif max_c == g_hex:
+        target_h = ((b_hex - r_hex) / delta + 2) / 6
+    else:
+        target_h = ((r_hex - g_hex) / delta + 4) / 6
+
+    # Fully transparent pixels are invisible, so only the box around visible ones needs recoloring
+    alpha = image.getchannel("A")
+    bbox = alpha.getbbox()
+    if bbox is None:
+        return
 
-            # convert pixel to HSV
-            h, s, v = colorsys.rgb_to_hsv(r / 255.0, g / 255.0, b / 255.0)
+    if bbox == (0, 0, *image.size):
+        recolored = _replace_hue(image, alpha, target_h)
+    else:
+        recolored = image.copy()
+        region = image.crop(bbox)
+        recolored.paste(_replace_hue(region, region.getchannel("A"), target_h), bbox[:2])
 
-            # replace hue
-            h = target_h
+    element.set_image(recolored)
 
-            # convert back to RGB
-            r2, g2, b2 = colorsys.hsv_to_rgb(h, s, v)
 
-            pixels[x, y] = (
-                int(r2 * 255),
-                int(g2 * 255),
-                int(b2 * 255),
-                a,
-            )
+def _replace_hue(image: Image, alpha: Image, hue: float) -> Image:
+    """Replace the hue of every pixel in an RGBA image, keeping saturation, value and alpha."""
+    _, s, v = image.convert("HSV").split()
+    h = Image.new("L", image.size, round(hue * 255))
 
-    element.set_image(image)
+    recolored = Image.merge("HSV", (h, s, v)).convert("RGBA")
+    recolored.putalpha(alpha)
+    return recolored
@@ -25,16 +25,19 @@ def get_alignment_position(  # noqa: PLR0913
     Returns:
         tuple: New position of the element as (x, y).
     """
-    logger.debug(
-        "Calculating alignment position with element_size=%s, parent_size=%s, x_align=%s, y_align=%s, "
-        "parent_position=%s, original_position=%s",
-        element_size,
-        parent_size,
-        x_align,
-        y_align,
-        parent_position,
-        original_position,
-    )
+    # Checked up front so the common non-debug path skips building the argument tuples
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug(
+            "Calculating alignment position with element_size=%s, parent_size=%s, x_align=%s, y_align=%s, "
+            "parent_position=%s, original_position=%s",
+            element_size,
+            parent_size,
+            x_align,
+            y_align,
+            parent_position,
+            original_position,
+        )
 
     width, height = element_size
     parent_x, parent_y = parent_position
@@ -44,6 +47,7 @@ def get_alignment_position(  # noqa: PLR0913
     new_x = default_x if x_align is None else x_align * (parent_width - width) + parent_x
     new_y = default_y if y_align is None else y_align * (parent_height - height) + parent_y
 
-    logger.debug("Calculated new position: (%s, %s)", new_x, new_y)
+    if debug:
+        logger.debug("Calculated new position: (%s, %s)", new_x, new_y)
 
     return (new_x, new_y)
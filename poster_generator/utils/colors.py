@@ -1,3 +1,5 @@
+import functools
+
 SHORT_HEX_LENGTH = 3
 HEX_RGB_LENGTH = 6
 HEX_RGBA_LENGTH = 8
@@ -19,35 +21,61 @@ def normalize_color(color_input: str | tuple | dict | None) -> tuple | None:
     if color_input is None:
         return None
 
+    # Already normalized colors are commonly passed back in, return them as-is
+    if type(color_input) is tuple and len(color_input) == RGBA_TUPLE_LENGTH:
+        return color_input
+
     if isinstance(color_input, str):
-        color_input = color_input.lstrip("#")
+        return _parse_hex_color(color_input)
+
+    if isinstance(color_input, tuple):
         lv = len(color_input)
+        if lv == RGB_TUPLE_LENGTH:
+            return (*color_input, DEFAULT_ALPHA)
+        if lv == RGBA_TUPLE_LENGTH:
+            return color_input
 
-        if lv == SHORT_HEX_LENGTH:
-            r, g, b = tuple(int(color_input[i] * 2, 16) for i in range(3))
-            return (r, g, b, DEFAULT_ALPHA)
+    if isinstance(color_input, dict):
+        r = _pick(color_input, ("r", "red"))
+        g = _pick(color_input, ("g", "green"))
+        b = _pick(color_input, ("b", "blue"))
+        a = _pick(color_input, ("a", "alpha"), DEFAULT_ALPHA)
+        if r is not None and g is not None and b is not None:
+            return (r, g, b, a)
 
-        if lv == HEX_RGB_LENGTH:
-            r, g, b = tuple(int(color_input[i:i + 2], 16) for i in (0, 2, 4))
-            return (r, g, b, DEFAULT_ALPHA)
+    msg = "Color input must be a hex string or an RGB/RGBA tuple"
+    raise ValueError(msg)
 
-        if lv == HEX_RGBA_LENGTH:
-            r, g, b, a = tuple(int(color_input[i:i + 2], 16) for i in (0, 2, 4, 6))
-            return (r, g, b, a)
 
+def _pick(mapping: dict, keys: tuple, default=None):
+    """Return the value of the first key present in the mapping, zero values included."""
+    for key in keys:
+        if key in mapping:
+            return mapping[key]
+    return default
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_hex_color(hex_color: str) -> tuple:
+    """Parse a hex color string into an RGBA tuple, cached since posters reuse a small palette."""
+    hex_color = hex_color.lstrip("#")
+    lv = len(hex_color)
+    if lv not in {SHORT_HEX_LENGTH, HEX_RGB_LENGTH, HEX_RGBA_LENGTH}:
         msg = "Hex color must be in format RRGGBB or RRGGBBAA"
         raise ValueError(msg)
 
-    if isinstance(color_input, tuple) and (RGB_TUPLE_LENGTH <= len(color_input) <= RGBA_TUPLE_LENGTH):
-        return color_input + (() if len(color_input) == RGBA_TUPLE_LENGTH else (DEFAULT_ALPHA,))
+    if lv == SHORT_HEX_LENGTH:
+        hex_color = hex_color[0] * 2 + hex_color[1] * 2 + hex_color[2] * 2
 
-    if isinstance(color_input, dict):
-        r = color_input.get("r") or color_input.get("red")
-        g = color_input.get("g") or color_input.get("green")
-        b = color_input.get("b") or color_input.get("blue")
-        a = color_input.get("a") or color_input.get("alpha", DEFAULT_ALPHA)
-        if r is not None and g is not None and b is not None:
-            return (r, g, b, a)
+    # fromhex parses every channel in one call, but skips whitespace so the byte count is checked too
+    try:
+        channels = bytes.fromhex(hex_color)
+    except ValueError:
+        channels = b""
+    if len(channels) * 2 != len(hex_color):
+        msg = f"Hex color contains invalid characters: #{hex_color}"
+        raise ValueError(msg)
 
-    msg = "Color input must be a hex string or an RGB/RGBA tuple"
-    raise ValueError(msg)
+    if len(channels) == RGBA_TUPLE_LENGTH:
+        return tuple(channels)
+    return (*channels, DEFAULT_ALPHA)
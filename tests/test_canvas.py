@@ -11,6 +11,8 @@ class StubElement:
     Minimal fake element for testing Canvas behavior.
     """
 
+    __slots__ = ("_canvas", "_identifier", "drawn", "height", "position", "ready", "width")
+
     def __init__(self, *, ready=True, position=(0, 0), width=10, height=10):
         self.ready = ready
         self.drawn = False  # track draw calls
@@ -26,10 +28,8 @@ class StubElement:
 
     def overlaps_region(self, x1, y1, x2, y2):
         # Element overlaps if any part of its bounding box intersects the region
-        ex1, ey1 = self.position
-        ex2 = ex1 + self.width
-        ey2 = ey1 + self.height
-        return not (ex2 < x1 or ex1 > x2 or ey2 < y1 or ey1 > y2)
+        ex, ey = self.position
+        return ex + self.width >= x1 and ex <= x2 and ey + self.height >= y1 and ey <= y2
 
     def get_size(self):
         return (self.width, self.height)
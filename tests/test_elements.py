@@ -5,6 +5,7 @@ import pytest
 from PIL import Image, ImageDraw
 
 from poster_generator.elements import EllipseElement, ImageElement, RectangleElement, TextElement
+from poster_generator.elements.text.fonts import FontManager
 from poster_generator.factories.element import ElementFactory
 
 # ==================== TextElement Tests ====================
@@ -102,6 +103,17 @@ def test_text_element_set_text():
     assert new_size[0] > original_size[0]
 
 
+def test_font_manager_reuses_fonts():
+    """Test that repeated font lookups share one font and registration refreshes them."""
+    manager = FontManager()
+    font = manager.get_font("Open Sans", 18)
+
+    assert manager.get_font("Open Sans", 18) is font
+
+    manager.register_font_family("Open Sans", FontManager.DEFAULT_FONT_PATH.with_name("bebas_neue_regular.ttf"))
+    assert manager.get_font("Open Sans", 18) is not font
+
+
 # ==================== ImageElement Tests ====================
 
 
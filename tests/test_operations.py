@@ -0,0 +1,57 @@
+# ruff: noqa: PLR2004, INP001
+"""Tests for element operations."""
+
+from PIL import Image
+
+from poster_generator.elements import ImageElement
+from poster_generator.factories.operation import OperationFactory
+from poster_generator.operations import apply_hue_shift, set_hue_from_hex
+
+
+def test_set_hue_from_hex():
+    elem = ImageElement(position=(0, 0))
+    elem.set_image(Image.new("RGBA", (4, 4), (200, 50, 50, 128)))
+
+    set_hue_from_hex(elem, "#00ff00")
+
+    r, g, b, a = elem.image.getpixel((0, 0))
+    assert g == 200
+    assert abs(r - 50) <= 1
+    assert abs(b - 50) <= 1
+    assert a == 128
+
+
+def test_apply_hue_shift():
+    elem = ImageElement(position=(0, 0))
+    elem.set_image(Image.new("RGBA", (4, 4), (255, 0, 0, 255)))
+
+    apply_hue_shift(elem, 120)
+
+    r, g, b, _ = elem.image.getpixel((0, 0))
+    assert g > 200
+    assert r < 10
+    assert b < 10
+
+
+def test_operation_factory_lookup():
+    factory = OperationFactory()
+
+    assert factory.get_func("apply_hue_shift") is apply_hue_shift
+    assert factory.supports("apply_hue_shift", "image")
+    assert not factory.supports("apply_hue_shift", "text")
+    assert not factory.supports("missing", "image")
+    assert factory.get_func("missing") is None
+    assert factory.get_operation("set_hue_from_hex")["func"] is set_hue_from_hex
+
+
+def test_set_hue_from_hex_transparent_border():
+    image = Image.new("RGBA", (10, 10), (200, 50, 50, 0))
+    image.paste((200, 50, 50, 255), (3, 3, 6, 6))
+    elem = ImageElement(position=(0, 0))
+    elem.set_image(image)
+
+    set_hue_from_hex(elem, "#00ff00")
+
+    assert elem.image.getpixel((0, 0)) == (200, 50, 50, 0)
+    assert elem.image.getpixel((4, 4))[1] == 200
+    assert elem.image.size == (10, 10)
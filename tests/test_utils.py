@@ -0,0 +1,36 @@
+# ruff: noqa: INP001
+"""Tests for color and alignment utilities."""
+
+import pytest
+
+from poster_generator.utils import normalize_color
+
+
+@pytest.mark.parametrize(
+    ("color", "expected"),
+    [
+        ("#3366cc", (51, 102, 204, 255)),
+        ("3366CC", (51, 102, 204, 255)),
+        ("#fff", (255, 255, 255, 255)),
+        ("#11223344", (17, 34, 51, 68)),
+    ],
+)
+def test_normalize_color_hex(color, expected):
+    assert normalize_color(color) == expected
+
+
+@pytest.mark.parametrize("color", ["#12", "#zzzzzz", "#12345é", "#11 22 33"])
+def test_normalize_color_invalid_hex(color):
+    with pytest.raises(ValueError, match="Hex color"):
+        normalize_color(color)
+
+
+def test_normalize_color_dict_keeps_zero_channels():
+    assert normalize_color({"r": 0, "green": 128, "b": 0, "a": 0}) == (0, 128, 0, 0)
+    assert normalize_color({"red": 10, "green": 20, "blue": 30}) == (10, 20, 30, 255)
+
+
+def test_normalize_color_tuple():
+    rgba = (1, 2, 3, 4)
+    assert normalize_color(rgba) is rgba
+    assert normalize_color((1, 2, 3)) == (1, 2, 3, 255)
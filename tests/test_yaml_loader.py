@@ -125,3 +125,104 @@ def test_bad_schema(loader):
 
     with pytest.raises(ValueError):  # noqa: PT011
         loader.deserialize(data, variables={})
+
+
+def test_read_source(loader, tmp_path):
+    path = tmp_path / "poster.yml"
+    path.write_text('schema: "1.0"\nsettings:\n  width: 640\n  background: "#123"\ntitle: Café\n', encoding="utf-8")
+
+    data = loader.read_source(str(path))
+    assert data == {"schema": "1.0", "settings": {"width": 640, "background": "#123"}, "title": "Café"}
+
+
+def test_relative_position_alignment(loader):
+    data = {
+        "schema": "1.0",
+        "settings": {"width": 400, "height": 300},
+        "layers": {
+            "main": {
+                "elements": {
+                    "box": {
+                        "type": "rectangle",
+                        "rel_position": {"source": "alignment", "value": "center,bottom"},
+                        "values": {"width": 100, "height": 50},
+                    },
+                },
+            },
+        },
+    }
+
+    canvas = loader.build_canvas(data, variables={})
+    assert canvas.get_first_element("box").position == (150, 250)
+
+
+def test_variable_substitution_in_element(loader):
+    data = {
+        "schema": "1.0",
+        "layers": {
+            "main": {
+                "elements": {
+                    "title": {
+                        "type": "text",
+                        "position": "--${pos}--",
+                        "values": {"text": "--${title}--", "fill": "--${color}--", "note": "--${title}-- again"},
+                        "operations": {"randomize_text_color": {"seeds": ["--${seed}--", 2]}},
+                    },
+                },
+            },
+        },
+    }
+    variables = {"pos": "10,20", "title": "Hello", "color": [1, 2, 3], "seed": 7}
+
+    element = loader.deserialize(data, variables=variables)["elements"]["title"]
+    assert element["position"] == (10.0, 20.0)
+    assert element["values"] == {"text": "Hello", "fill": (1, 2, 3), "note": "--${title}-- again"}
+    assert element["operations"] == {"randomize_text_color": {"seeds": [7, 2]}}
+
+
+def test_percentage_positions(loader):
+    data = {"schema": "1.0", "anchors": {"a": "50%, 12.5%", "b": ["100%", "57%"]}}
+
+    anchors = loader.deserialize(data, variables={})["anchors"]
+    assert anchors == {"a": (0.5, 0.125), "b": (1.0, 0.57)}
+
+
+def test_read_source_rejects_bad_schema_header(loader, tmp_path):
+    path = tmp_path / "poster.yml"
+    path.write_text('schema: "2.0"\nlayers: {broken\n')
+
+    with pytest.raises(ValueError, match=r"Unsupported schema version: 2\.0"):
+        loader.read_source(str(path))
+
+
+def test_load_many(loader, tmp_path):
+    paths = []
+    for width in (100, 200, 300):
+        path = tmp_path / f"poster_{width}.yml"
+        path.write_text(f'schema: "1.0"\nsettings:\n  width: {width}\n  height: --${{h}}--\n')
+        paths.append(str(path))
+
+    canvases = loader.load_many(paths, variables={"h": 50})
+    assert [canvas.get_size() for canvas in canvases] == [(100, 50), (200, 50), (300, 50)]
+
+
+def test_read_source_cache(loader, tmp_path, monkeypatch):
+    monkeypatch.setattr(YamlLoader, "CACHE_PARSED_SOURCES", True)
+    path = tmp_path / "poster.yml"
+    path.write_text('schema: "1.0"\nsettings:\n  width: 640\n')
+
+    assert loader.read_source(str(path)) == {"schema": "1.0", "settings": {"width": 640}}
+    assert (tmp_path / "poster.yml.cache").exists()
+    assert loader.read_source(str(path)) == {"schema": "1.0", "settings": {"width": 640}}
+
+    path.write_text('schema: "1.0"\nsettings:\n  width: 1280\n')
+    assert loader.read_source(str(path)) == {"schema": "1.0", "settings": {"width": 1280}}
+
+
+def test_read_source_returns_copies(loader, tmp_path):
+    path = tmp_path / "poster.yml"
+    path.write_text('schema: "1.0"\nsettings:\n  width: 640\n')
+
+    data = loader.read_source(str(path))
+    data["settings"]["width"] = 1
+    assert loader.read_source(str(path)) == {"schema": "1.0", "settings": {"width": 640}}